@@ -1,8 +1,7 @@
 """This module contains the Account class which is used to get balances, orders and positions from
 the account."""
 
-import datetime
-
+import orjson
 import pandas as pd
 from utils import camel_to_snake, flatten
 
@@ -23,7 +22,8 @@ class Account(Broker):
             pd.Series: The account balances.
         """
         res = self.client.get_account(account_id=self.ACCOUNT_ID)
-        data = res.json()['securitiesAccount']['currentBalances']
+        data = orjson.loads(
+            res.content)['securitiesAccount']['currentBalances']
         account = pd.Series(data)
         fields = {
             'liquidationValue': 'balance',
@@ -42,7 +42,8 @@ class Account(Broker):
         """
         res = self.client.get_account(self.ACCOUNT_ID,
                                       fields=self.client.Account.Fields.ORDERS)
-        orders = res.json()['securitiesAccount']['orderStrategies']
+        orders = orjson.loads(
+            res.content)['securitiesAccount']['orderStrategies']
         orders = pd.DataFrame(orders)
         orders.columns = [camel_to_snake(c) for c in orders.columns]
         orders.drop([
@@ -61,10 +62,8 @@ class Account(Broker):
         """
         res = self.client.get_account(
             self.ACCOUNT_ID, fields=self.client.Account.Fields.POSITIONS)
-        data = [
-            flatten(position)
-            for position in res.json()['securitiesAccount']['positions']
-        ]
+        positions = orjson.loads(res.content)['securitiesAccount']['positions']
+        data = [flatten(position) for position in positions]
         cols = {
             'shortQuantity': 'qty_short',
             'longQuantity': 'qty_long',
@@ -80,12 +79,14 @@ class Account(Broker):
         positions = pd.DataFrame(data)[cols.keys()].rename(cols, axis=1)
         positions['qty'] = positions['qty_long'] - positions['qty_short']
 
-        expiration_dates_and_strikes = positions['symbol'].str.split(
-            r'_', expand=True)[1].str.split(r'[CP]', expand=True)
-        positions['expiration_date'] = expiration_dates_and_strikes[0].apply(
-            lambda dt: datetime.datetime.strptime(dt, '%m%d%y').strftime(
-                '%d%b%y').upper() if dt else dt)
-        positions['strike'] = expiration_dates_and_strikes[1]
+        # Option symbols look like 'MSFT_082021P287.5'
+        option_symbols = positions['symbol'].str.extract(
+            r'_(?P<expiration>\d{6})(?P<put_call>[CP])(?P<strike>\d+(?:\.\d+)?)$'
+        )
+        positions['expiration_date'] = pd.to_datetime(
+            option_symbols['expiration'], format='%m%d%y',
+            errors='coerce').dt.strftime('%d%b%y').str.upper()
+        positions['strike'] = option_symbols['strike'].astype('float64')
 
         positions.sort_values(by=['expiration_date', 'underlying', 'strike'],
                               ascending=[True, True, False],
@@ -1,9 +1,11 @@
 """This module contains the Broker class which is used to communicate with TD Ameritrade."""
 
+import asyncio
 import os
 import pathlib
-from typing import List
+from typing import Dict, List
 
+import orjson
 import pandas as pd
 import tda
 from utils import camel_to_snake
@@ -16,6 +18,8 @@ class Broker:
     AUTH_KEY = f'{API_KEY}@AMER.OAUTHAP'
     REDIRECT_URI = os.environ.get('TD_REDIRECT_URI')
     ACCOUNT_ID = os.environ.get('TD_ACCOUNT_ID')
+    MAX_CONCURRENT_REQUESTS = 10
+    _CLIENT = None
 
     def __init__(self):
         self.client = self.connect()
@@ -24,9 +28,14 @@ class Broker:
         """Create an HTTP client that is used for making
         requests to TD Ameritrade.
 
+        The client is created once and shared by all Broker instances.
+
         Returns:
             tda.client.synchronous.Client: Object used to communicate with TD.
         """
+        if Broker._CLIENT is not None:
+            return Broker._CLIENT
+
         try:
             client = tda.auth.client_from_token_file(self.TOKEN_PATH,
                                                      self.AUTH_KEY)
@@ -37,8 +46,54 @@ class Broker:
                 client = tda.auth.client_from_login_flow(
                     driver, self.AUTH_KEY, self.REDIRECT_URI, self.TOKEN_PATH)
 
+        Broker._CLIENT = client
         return client
 
+    def aconnect(self) -> tda.client.asynchronous.AsyncClient:
+        """Create an asynchronous HTTP client that is used for making
+        concurrent requests to TD Ameritrade.
+
+        Relies on the token file created by `connect`.
+
+        Returns:
+            tda.client.asynchronous.AsyncClient: Object used to communicate with TD.
+        """
+        return tda.auth.client_from_token_file(self.TOKEN_PATH,
+                                               self.AUTH_KEY,
+                                               asyncio=True)
+
+    async def get_option_chains(self, symbols: List[str]) -> Dict[str, dict]:
+        """Get the raw option chains data for multiple symbols concurrently.
+
+        At most `MAX_CONCURRENT_REQUESTS` requests are in flight at once.
+
+        Example:
+            chains = asyncio.run(broker.get_option_chains(['MSFT', 'AAPL']))
+
+        Args:
+            symbols (List[str]): List of underlying symbols.
+
+        Returns:
+            Dict[str, dict]: The raw options data, keyed by underlying symbol.
+        """
+        client = self.aconnect()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def get_option_chain(symbol: str) -> dict:
+            async with semaphore:
+                res = await client.get_option_chain(symbol)
+            data = orjson.loads(res.content)
+            assert data['status'] == 'SUCCESS'
+            return data
+
+        try:
+            chains = await asyncio.gather(
+                *(get_option_chain(symbol) for symbol in symbols))
+        finally:
+            await client.close_async_session()
+
+        return dict(zip(symbols, chains))
+
     def get_option_chain(self, symbol: str) -> dict:
         """Get the raw option chains data for a symbol.
 
@@ -51,7 +106,7 @@ class Broker:
             dict: The raw options data.
         """
         res = self.client.get_option_chain(symbol)
-        data = res.json()
+        data = orjson.loads(res.content)
         assert data['status'] == 'SUCCESS'
         return data
 
@@ -73,7 +128,7 @@ class Broker:
             'total_volume': 'volume'
         }
         res = self.client.get_quotes(symbols)
-        quotes = pd.DataFrame(res.json()).T
+        quotes = pd.DataFrame(orjson.loads(res.content)).T
         quotes.columns = [camel_to_snake(name) for name in quotes.columns]
         quotes = quotes[columns.keys()]
         quotes.rename(columns=columns, inplace=True)
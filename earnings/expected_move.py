@@ -7,6 +7,7 @@ our strikes more efficiently.
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from earnings.option_chain import OptionChain
@@ -33,6 +34,30 @@ class Straddle(OptionChain):
                                            in_the_money=True,
                                            weeklies=True).dropna()
 
+    @classmethod
+    def from_chain(cls, parent_chain: OptionChain,
+                   option_chain: pd.DataFrame) -> 'Straddle':
+        """Create a Straddle from an option chain that was already retrieved,
+        without connecting or requesting the chain from TD Ameritrade again.
+
+        Args:
+            parent_chain (OptionChain): The option chain object to take the client and raw data from.
+            option_chain (pd.DataFrame): The built option chain to pick the straddle from.
+
+        Returns:
+            Straddle: The Straddle for the same underlying.
+        """
+        straddle = cls.__new__(cls)
+        straddle.client = parent_chain.client
+        straddle.raw_data = parent_chain.raw_data
+        straddle.underlying_price = parent_chain.underlying_price
+        straddle.calls = parent_chain.calls
+        straddle.puts = parent_chain.puts
+        straddle.COLUMNS = parent_chain.COLUMNS
+        straddle.COLUMN_TYPES = parent_chain.COLUMN_TYPES
+        straddle.option_chain = option_chain
+        return straddle
+
     def _build(self) -> pd.DataFrame:
         """Build the Straddle strategy.
 
@@ -41,12 +66,9 @@ class Straddle(OptionChain):
         Returns:
             pd.DataFrame: The Straddle strategy.
         """
-        idx_atm = self.option_chain['strike'].sub(
-            self.underlying_price).abs().argmin()
-        atm_strike = self.option_chain.loc[idx_atm, 'strike']
-        straddle = self.option_chain[self.option_chain['strike'].eq(
-            atm_strike)]
-        straddle.reset_index(drop=True, inplace=True)
+        strikes = self.option_chain['strike'].to_numpy()
+        atm_strike = strikes[np.abs(strikes - self.underlying_price).argmin()]
+        straddle = self.option_chain[strikes == atm_strike]
         return straddle
 
     @property
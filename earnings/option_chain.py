@@ -4,7 +4,7 @@ for underlying tickers
 
 import json
 import os
-from typing import Union
+from typing import Optional, Union
 
 import pandas as pd
 
@@ -12,14 +12,17 @@ from earnings.broker import Broker
 
 
 class OptionChain(Broker):
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, raw_data: Optional[dict] = None):
         """Constructor for the option chain class.
 
         Args:
             symbol (str): The underlying's symbol.
+            raw_data (Optional[dict], optional): The raw option chain data, if it was already retrieved (see `Broker.get_option_chains`). Defaults to None.
         """
         super().__init__()
-        self.raw_data = self.get_option_chain(symbol)
+        if raw_data is None:
+            raw_data = self.get_option_chain(symbol)
+        self.raw_data = raw_data
         self.underlying_price = self.raw_data['underlyingPrice']
         self.calls = self.raw_data['callExpDateMap']
         self.puts = self.raw_data['putExpDateMap']
@@ -65,30 +68,55 @@ class OptionChain(Broker):
         expiration_cycle = self._select_expiration(dte, weeklies)
 
         # Get the calls and puts from the selected expiration cycle
-        calls = {k: v[0] for k, v in self.calls[expiration_cycle].items()}
-        puts = {k: v[0] for k, v in self.puts[expiration_cycle].items()}
-
-        calls = pd.DataFrame(calls).T.reset_index().rename(
-            columns=self.COLUMNS)
-        puts = pd.DataFrame(puts).T.reset_index().rename(columns=self.COLUMNS)
-        option_chain = pd.concat([calls, puts])[self.COLUMNS.values()]
-
-        # Convert data types
-        option_chain['strike'] = option_chain['strike'].astype('float64')
-        option_chain['option_type'] = option_chain['option_type'].astype(
-            object)
+        calls = self._to_frame(self.calls[expiration_cycle], in_the_money)
+        puts = self._to_frame(self.puts[expiration_cycle], in_the_money)
+        option_chain = pd.concat([calls, puts])
+
+        # Convert data types, only casting columns that need it
         option_chain['expiration_date'] = pd.to_datetime(
             option_chain['expiration_date'], unit='ms').dt.strftime('%Y-%m-%d')
-        option_chain = option_chain.astype(self.COLUMN_TYPES)
+        for column, dtype in self.COLUMN_TYPES.items():
+            if option_chain[column].dtype != dtype:
+                option_chain[column] = option_chain[column].astype(dtype)
+
+        # Sort by strikes, calls and puts are each already sorted so a stable
+        # sort only has to merge the two runs
+        option_chain.sort_values(by='strike',
+                                 ascending=True,
+                                 kind='mergesort',
+                                 ignore_index=True,
+                                 inplace=True)
+
+        return option_chain
 
-        if not in_the_money:
-            option_chain = option_chain[option_chain['in_the_money'].eq(False)]
+    def _to_frame(self,
+                  options: dict,
+                  in_the_money: bool = True) -> pd.DataFrame:
+        """Converts the raw options of one expiration cycle into a DataFrame.
 
-        # Sort by strikes
-        option_chain.sort_values(by='strike', ascending=True, inplace=True)
-        option_chain.reset_index(drop=True, inplace=True)
+        The frame is built column by column, in the order of `self.COLUMNS`, so each
+        column is backed by contiguous memory and column reductions stay cheap.
 
-        return option_chain
+        Args:
+            options (dict): Raw options data keyed by strike, as returned by TD Ameritrade.
+            in_the_money (bool, optional): Whether to include in-the-money options. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The options, one row per strike.
+        """
+        # Skip unwanted options before any of their fields are collected
+        options = {
+            k: v[0]
+            for k, v in options.items()
+            if in_the_money or not v[0].get('inTheMoney')
+        }
+        contracts = list(options.values())
+        columns = {self.COLUMNS['index']: list(options.keys())}
+        for field, column in self.COLUMNS.items():
+            if field != 'index':
+                columns[column] = [c.get(field) for c in contracts]
+
+        return pd.DataFrame(columns)
 
     def _expirations(self, weeklies: bool = True) -> pd.DataFrame:
         """Returns the available expiration dates for this symbol.
@@ -100,16 +128,13 @@ class OptionChain(Broker):
             pd.DataFrame: A DataFrame containing the expiration dates, days to expiration and
             type of expiration (monthly/weekly).
         """
-        expirations = [e.split(':') for e in self.calls.keys()]
-        expiration_types = [
-            pd.Series(self.calls[k]).iloc[0][0]["expirationType"]
-            for k in self.calls.keys()
-        ]
-        expirations = [
-            expiration + ['MONTHLY' if expiration_type == 'R' else 'WEEKLY']
-            for expiration, expiration_type in zip(expirations,
-                                                   expiration_types)
-        ]
+        expirations = []
+        for expiration, options in self.calls.items():
+            date, dte = expiration.split(':')
+            # All strikes of an expiration share the same expiration type
+            expiration_type = next(iter(options.values()))[0]['expirationType']
+            expirations.append(
+                (date, dte, 'MONTHLY' if expiration_type == 'R' else 'WEEKLY'))
         expirations = pd.DataFrame(expirations,
                                    columns=['date', 'dte', 'type'])
 
@@ -19,14 +19,16 @@ FINVIZ_PASSWORD - for your login password
 Hope you find this tool useful.
 """
 
+import io
 import os
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 
 import numpy as np
 import pandas as pd
 import requests
 import user_agent
-from bs4 import BeautifulSoup
+from lxml import html
 
 
 class Scanner:
@@ -66,11 +68,11 @@ class Scanner:
         earnings = self._clean_earnings(earnings)
         return earnings
 
-    def _get_earnings(self) -> List[List[str]]:
+    def _get_earnings(self) -> pd.DataFrame:
         """Get the raw earnings reports data from Finviz.
 
         Returns:
-            List[List[str]]: Data grouped as a nested list, each item contains one row of data.
+            pd.DataFrame: The raw screener rows, one row per report.
         """
         with requests.Session() as session:
             # Post login form
@@ -95,37 +97,57 @@ class Scanner:
                 'c': '0,1,6,65,66,68'
             }]
 
-            earnings = []
-
-            for params in target_params:
-                url = params.pop('url')
-                req = session.get(url, params=params, headers=self.headers)
-                soup = BeautifulSoup(req.content, 'lxml')
-                data = [
-                    td.a.text
-                    for td in soup.find_all('td',
-                                            class_='screener-body-table-nw')
-                ]
-                cols = 6
-                # Grouping the data by its intended columns
-                earnings += [
-                    data[n + 1:n + cols] for n in range(0, len(data), cols)
-                ]
+            # Both screeners are fetched concurrently, results keep their order
+            with ThreadPoolExecutor(max_workers=len(target_params)) as pool:
+                screeners = pool.map(
+                    lambda params: self._get_screener(session, params),
+                    target_params)
+                earnings = pd.concat(screeners, ignore_index=True)
 
         return earnings
 
-    def _clean_earnings(self, earnings: List[List[str]]) -> pd.DataFrame:
+    def _get_screener(self, session: requests.Session,
+                      params: Dict[str, str]) -> pd.DataFrame:
+        """Get and parse a single screener page from Finviz.
+
+        Args:
+            session (requests.Session): A session that is logged into Finviz.
+            params (Dict[str, str]): The screener URL and its query parameters.
+
+        Returns:
+            pd.DataFrame: The screener table, with the symbol, market cap, price, change and time columns.
+        """
+        columns = ['symbol', 'market_cap', 'price', 'change', 'time']
+        params = params.copy()
+        url = params.pop('url')
+        req = session.get(url, params=params, headers=self.headers)
+        tree = html.fromstring(req.content)
+        # The results table is the one holding the screener body cells
+        tables = tree.xpath(
+            '//td[contains(concat(" ", normalize-space(@class), " "),'
+            ' " screener-body-table-nw ")]/ancestor::table[1]')
+        if not tables:
+            return pd.DataFrame(columns=columns)
+
+        table = io.StringIO(html.tostring(tables[0], encoding='unicode'))
+        screener = pd.read_html(table,
+                                header=0,
+                                keep_default_na=False,
+                                flavor='lxml')[0]
+        # Dropping the row number column
+        screener = screener.iloc[:, 1:len(columns) + 1]
+        screener.columns = columns
+        return screener
+
+    def _clean_earnings(self, earnings: pd.DataFrame) -> pd.DataFrame:
         """Transforms raw earnings data into an easy-to-work-with DataFrame object.
 
         Args:
-            earnings (List[List[str]]): The raw data, as retrieved from Finviz.
+            earnings (pd.DataFrame): The raw data, as retrieved from Finviz.
 
         Returns:
             pd.DataFrame: The earnings DataFrame, sorted by market caps.
         """
-        earnings = pd.DataFrame(
-            earnings,
-            columns=['symbol', 'market_cap', 'price', 'change', 'time'])
         earnings['price'] = earnings['price'].astype('float64')
         earnings['change'] = earnings['change'].str.replace(
             '%', '').astype('float64') / 100
@@ -161,7 +183,7 @@ class Scanner:
         """
         m = {'K': 3, 'M': 6, 'B': 9, 'T': 12}
         market_caps = market_caps.replace('-', np.nan)
-        market_caps = [
-            float(i[:-1]) * 10**m[i[-1]] / 1_000_000_000 for i in market_caps
-        ]
+        values = market_caps.str.slice(0, -1).astype('float64')
+        exponents = market_caps.str.slice(-1).map(m).astype('float64')
+        market_caps = values * np.power(10.0, exponents - 9)
         return market_caps
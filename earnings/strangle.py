@@ -5,8 +5,9 @@ We want a strangle that covers the expected move, is liquid and has a
 minimum amount of premium in it.
 """
 
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from earnings.expected_move import Straddle
@@ -14,39 +15,46 @@ from earnings.option_chain import OptionChain
 
 
 class Strangle(OptionChain):
-    def __init__(self, symbol: str, dte: int = 0):
+    def __init__(self,
+                 symbol: str,
+                 dte: int = 0,
+                 raw_data: Optional[dict] = None):
         """Constructor for the Strangle class.
 
         Args:
             symbol (str): The underlying symbol.
             dte (int, optional): The closest days to expiration. Defaults to 0.
+            raw_data (Optional[dict], optional): The raw option chain data, if it was already retrieved. Defaults to None.
         """
-        super().__init__(symbol)
+        super().__init__(symbol, raw_data)
         self.option_chain = self.build(dte, in_the_money=False,
                                        weeklies=True).dropna()
-        self.expected_move = Straddle(symbol, dte,
-                                      self.option_chain).expected_move
+        self.expected_move = Straddle.from_chain(
+            self, self.option_chain).expected_move
 
-    def covers_expected_move(self, call_strike: float, put_strike: float,
-                             premium: float) -> bool:
+    def covers_expected_move(
+            self, call_strike: Union[float, np.ndarray],
+            put_strike: Union[float, np.ndarray],
+            premium: Union[float, np.ndarray]) -> Union[bool, np.ndarray]:
         """Checks if a strangle is covering the expected move with its
         break even points, given the call strike, put strike and
         premium.
 
+        Also works element-wise on arrays of strikes and premiums.
+
         Args:
-            call_strike (float): [description]
-            put_strike (float): [description]
-            premium (float): [description]
+            call_strike (Union[float, np.ndarray]): The call strike.
+            put_strike (Union[float, np.ndarray]): The put strike.
+            premium (Union[float, np.ndarray]): The premium collected for the strangle.
 
         Returns:
-            bool: [description]
+            Union[bool, np.ndarray]: Whether the break even points cover the expected move.
         """
         top_break_even = call_strike + premium
         bottom_break_even = put_strike - premium
         top = self.underlying_price + self.expected_move
         bottom = self.underlying_price - self.expected_move
-        covers = True if (top_break_even > top) and (
-            bottom_break_even < bottom) else False
+        covers = (top_break_even > top) & (bottom_break_even < bottom)
 
         return covers
 
@@ -60,43 +68,36 @@ class Strangle(OptionChain):
         Returns:
             Optional[pd.DataFrame]: The Strangle strategy.
         """
-        calls = self.option_chain[self.option_chain['option_type'].eq(
-            'CALL')].sort_values('strike', ascending=True)
-        puts = self.option_chain[self.option_chain['option_type'].eq(
-            'PUT')].sort_values('strike', ascending=False)
-
-        strangles = []
-
-        for call_strike, put_strike in zip(calls['strike'], puts['strike']):
-            # Create the strangle
-            call_option = calls[calls['strike'].eq(call_strike)].reset_index(
-                drop=True)
-            put_option = puts[puts['strike'].eq(put_strike)].reset_index(
-                drop=True)
-            strangle = pd.concat([put_option,
-                                  call_option]).reset_index(drop=True)
-
-            # Aggregate some info about the strangle
-            bid = strangle['bid'].sum()
-            ask = strangle['ask'].sum()
-            mid = (ask + bid) / 2
+        # Split the chain into calls and puts in a single pass
+        groups = self.option_chain.groupby('option_type', sort=False)
+        if not {'CALL', 'PUT'}.issubset(groups.groups):
+            return None
+        calls = groups.get_group('CALL').sort_values('strike', ascending=True)
+        puts = groups.get_group('PUT').sort_values('strike', ascending=False)
 
-            # We might wanna check the spreads later:
-            # spread = ask - bid
-            # relative_spread = spread / mid
+        # Pair the i-th closest call with the i-th closest put
+        n = min(len(calls), len(puts))
+        call_strikes = calls['strike'].to_numpy()[:n]
+        put_strikes = puts['strike'].to_numpy()[:n]
+        bid = calls['bid'].to_numpy()[:n] + puts['bid'].to_numpy()[:n]
+        ask = calls['ask'].to_numpy()[:n] + puts['ask'].to_numpy()[:n]
 
-            premium = (bid + ask) / 2
+        # We might wanna check the spreads later:
+        # spread = ask - bid
+        # relative_spread = spread / mid
 
-            if premium < min_premium:
-                continue
+        premium = (bid + ask) / 2
 
-            if self.covers_expected_move(call_strike, put_strike, premium):
-                strangles.append(strangle)
+        valid = (premium >= min_premium) & self.covers_expected_move(
+            call_strikes, put_strikes, premium)
+        candidates = np.flatnonzero(valid)
 
-        if not strangles:
+        if not candidates.size:
             return None
 
         # Choose the strangle furthest away from the current price
-        strangle = strangles[-1]
+        i = candidates[-1]
+        strangle = pd.concat([puts.iloc[[i]],
+                              calls.iloc[[i]]]).reset_index(drop=True)
 
         return strangle
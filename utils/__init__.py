@@ -1,20 +1,32 @@
-import collections
+import collections.abc
 import re
 
 
 def flatten(d: dict, parent_key='', sep='_'):
     """Flatten a dictionary"""
-    items = []
-    for k, v in d.items():
-        new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, collections.MutableMapping):
-            items.extend(flatten(v, new_key, sep=sep).items())
+    flat = {}
+    # Iterators of the dictionaries being walked, innermost last
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = prefix + sep + k if prefix else k
+            if isinstance(v, collections.abc.Mapping):
+                stack.append((new_key, iter(v.items())))
+                break
+            flat[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return flat
+
+
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_SNAKE_CACHE = {}
 
 
 def camel_to_snake(name):
     '''Converts CamelCased strings to snake_case'''
-    name = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
-    return name
\ No newline at end of file
+    snake = _SNAKE_CACHE.get(name)
+    if snake is None:
+        snake = _SNAKE_CACHE[name] = _CAMEL_RE.sub('_', name).lower()
+    return snake
\ No newline at end of file